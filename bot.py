@@ -2,15 +2,31 @@ import os
 import re
 import json
 import logging
+import signal
 import asyncio
+import contextlib
+import bisect
+from collections import Counter
+from functools import lru_cache, partial
+from pathlib import Path
 from datetime import datetime, timedelta, timezone, time
-from typing import List, Tuple, Dict, Optional
+from typing import Callable, List, Tuple, Dict, Optional, Set
 
 import discord
 from discord.ext import commands, tasks
 import aiosqlite
 from dotenv import load_dotenv
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to one combined regex
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib parser reads the same files
+    orjson = None
+
 # -------------------------
 # Config & Logging
 # -------------------------
@@ -25,6 +41,12 @@ log = logging.getLogger("term-bot")
 
 DB_PATH = os.getenv("DB_PATH", "termbot.sqlite3")
 COMMAND_PREFIX = os.getenv("PREFIX", "!")
+# Read-only connections serving command queries alongside the single writer
+DB_READERS = max(1, int(os.getenv("DB_READERS", "4")))
+# Write-behind batching: matched messages are committed together in one transaction
+WRITE_BATCH_MAX = 500      # messages per transaction
+WRITE_BATCH_WAIT = 0.05    # seconds to let a burst accumulate before committing
+WRITE_QUEUE_MAX = 10000    # queued messages before on_message waits for the writer
 
 # Power users (comma-separated Discord user IDs). They bypass admin checks and can run global queries.
 POWER_USER_IDS = {
@@ -50,14 +72,13 @@ intents.members = True  # Enable for better user tracking
 # Enhanced Database schema
 # -------------------------
 SCHEMA = '''
-PRAGMA journal_mode=WAL;
 CREATE TABLE IF NOT EXISTS terms (
     guild_id INTEGER NOT NULL,
     term TEXT NOT NULL,
     created_by INTEGER,
     created_at TEXT,
     PRIMARY KEY (guild_id, term)
-);
+) WITHOUT ROWID;
 CREATE TABLE IF NOT EXISTS term_meta (
     guild_id INTEGER NOT NULL,
     term TEXT NOT NULL,
@@ -67,7 +88,7 @@ CREATE TABLE IF NOT EXISTS term_meta (
     weekly_count INTEGER DEFAULT 0,
     monthly_count INTEGER DEFAULT 0,
     PRIMARY KEY (guild_id, term)
-);
+) WITHOUT ROWID;
 CREATE TABLE IF NOT EXISTS hits (
     guild_id INTEGER NOT NULL,
     term TEXT NOT NULL,
@@ -78,7 +99,7 @@ CREATE TABLE IF NOT EXISTS hits (
     weekly_count INTEGER DEFAULT 0,
     monthly_count INTEGER DEFAULT 0,
     PRIMARY KEY (guild_id, term, user_id)
-);
+) WITHOUT ROWID;
 CREATE TABLE IF NOT EXISTS messages (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     guild_id INTEGER NOT NULL,
@@ -96,20 +117,20 @@ CREATE TABLE IF NOT EXISTS forbidden_phrases (
     phrase TEXT NOT NULL,
     action TEXT DEFAULT 'warn',
     PRIMARY KEY (guild_id, phrase)
-);
+) WITHOUT ROWID;
 CREATE TABLE IF NOT EXISTS timeout_phrases (
     guild_id INTEGER NOT NULL,
     phrase TEXT NOT NULL,
     duration INTEGER DEFAULT 300,
     PRIMARY KEY (guild_id, phrase)
-);
+) WITHOUT ROWID;
 CREATE TABLE IF NOT EXISTS keyword_responses (
     guild_id INTEGER NOT NULL,
     keyword TEXT NOT NULL,
     response TEXT NOT NULL,
     response_type TEXT DEFAULT 'message',
     PRIMARY KEY (guild_id, keyword)
-);
+) WITHOUT ROWID;
 -- Enhanced ignored channels
 CREATE TABLE IF NOT EXISTS ignored_channels (
     guild_id INTEGER NOT NULL,
@@ -117,7 +138,7 @@ CREATE TABLE IF NOT EXISTS ignored_channels (
     ignored_by INTEGER,
     ignored_at TEXT,
     PRIMARY KEY (guild_id, channel_id)
-);
+) WITHOUT ROWID;
 -- Enhanced guild settings
 CREATE TABLE IF NOT EXISTS guild_settings (
     guild_id INTEGER NOT NULL PRIMARY KEY,
@@ -137,7 +158,7 @@ CREATE TABLE IF NOT EXISTS user_cooldowns (
     term TEXT NOT NULL,
     last_increment TEXT,
     PRIMARY KEY (guild_id, user_id, term)
-);
+) WITHOUT ROWID;
 -- New: Term categories
 CREATE TABLE IF NOT EXISTS term_categories (
     guild_id INTEGER NOT NULL,
@@ -178,7 +199,7 @@ CREATE TABLE IF NOT EXISTS daily_stats (
     total_mentions INTEGER DEFAULT 0,
     unique_users INTEGER DEFAULT 0,
     PRIMARY KEY (guild_id, date, term)
-);
+) WITHOUT ROWID;
 -- New: Term aliases
 CREATE TABLE IF NOT EXISTS term_aliases (
     guild_id INTEGER NOT NULL,
@@ -195,6 +216,46 @@ CREATE TABLE IF NOT EXISTS user_preferences (
     setting_value TEXT NOT NULL,
     PRIMARY KEY (guild_id, user_id, setting_name)
 );
+-- Per-user totals across all terms for the all-time leaderboard, maintained by the hits triggers below.
+-- REPLACE into hits would skip the delete trigger (recursive_triggers is off), so writers upsert instead.
+CREATE TABLE IF NOT EXISTS user_totals (
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    user_name TEXT NOT NULL,
+    total_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, user_id)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS hits_user_totals_ai AFTER INSERT ON hits BEGIN
+    INSERT INTO user_totals(guild_id, user_id, user_name, total_count)
+    VALUES (new.guild_id, new.user_id, new.user_name, new.count)
+    ON CONFLICT(guild_id, user_id) DO UPDATE SET
+        total_count = total_count + excluded.total_count, user_name = excluded.user_name;
+END;
+-- An upsert, not a plain UPDATE: the delete trigger drops users whose total reaches zero
+CREATE TRIGGER IF NOT EXISTS hits_user_totals_au AFTER UPDATE OF count, user_name ON hits BEGIN
+    INSERT INTO user_totals(guild_id, user_id, user_name, total_count)
+    VALUES (new.guild_id, new.user_id, new.user_name, new.count - old.count)
+    ON CONFLICT(guild_id, user_id) DO UPDATE SET
+        total_count = total_count + excluded.total_count, user_name = excluded.user_name;
+END;
+CREATE TRIGGER IF NOT EXISTS hits_user_totals_ad AFTER DELETE ON hits BEGIN
+    UPDATE user_totals SET total_count = total_count - old.count
+    WHERE guild_id = old.guild_id AND user_id = old.user_id;
+    DELETE FROM user_totals WHERE guild_id = old.guild_id AND user_id = old.user_id AND total_count <= 0;
+END;
+-- Indexes for the per-term top-N and time-range reads; the top-N ones carry every
+-- selected column so the LIMIT queries never touch the table rows
+CREATE INDEX IF NOT EXISTS idx_hits_top ON hits(guild_id, term, count DESC, user_name, last_seen);
+CREATE INDEX IF NOT EXISTS idx_messages_term_created ON messages(guild_id, term, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_meta_top ON term_meta(guild_id, total_count DESC, term);
+-- Leaderboard: range-scan a guild's hits by last_seen and sum per user from the index alone
+CREATE INDEX IF NOT EXISTS idx_hits_guild_lastseen ON hits(guild_id, last_seen, user_id, user_name, count);
+CREATE INDEX IF NOT EXISTS idx_user_totals_top ON user_totals(guild_id, total_count DESC, user_name);
+-- Per-guild time windows over messages (daily summary, dashboard, cleanup) and per-user hit aggregates
+CREATE INDEX IF NOT EXISTS idx_messages_guild_created ON messages(guild_id, created_at, term, user_id);
+CREATE INDEX IF NOT EXISTS idx_hits_guild_user ON hits(guild_id, user_id, term, count);
+-- Cross-guild per-term totals on the web dashboard
+CREATE INDEX IF NOT EXISTS idx_meta_term_total ON term_meta(term, guild_id, total_count);
 '''
 
 # Default achievements
@@ -209,19 +270,148 @@ DEFAULT_ACHIEVEMENTS = [
     ("Monthly King", "Top user for the month", "monthly_top", 1, "🔥")
 ]
 
+# Connection-scoped tuning applied on every connect. synchronous=NORMAL is
+# crash-safe under WAL but can lose the last commit on power loss, which is
+# acceptable for chat analytics. Checkpointing every 2000 pages instead of
+# 1000 lets the writer's batches run longer before it stops to fold the WAL back.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA wal_autocheckpoint=2000",
+)
+
+# sqlite3 keeps prepared statements keyed by SQL text; leave room for every command query
+STATEMENT_CACHE_SIZE = 256
+
+async def apply_pragmas(db: aiosqlite.Connection):
+    for pragma in PRAGMAS:
+        await db.execute(pragma)
+
+# Write-behind statements, kept as fixed text so every batch reuses the prepared statement
+SQL_UPSERT_META = (
+    "INSERT INTO term_meta(guild_id, term, total_count, last_mentioned, last_user) "
+    "VALUES(?,?,?,?,?) ON CONFLICT(guild_id, term) DO UPDATE SET "
+    "total_count = term_meta.total_count + excluded.total_count, "
+    "last_mentioned = excluded.last_mentioned, last_user = excluded.last_user"
+)
+SQL_UPSERT_HIT = (
+    "INSERT INTO hits(guild_id, term, user_id, user_name, count, last_seen) "
+    "VALUES(?,?,?,?,?,?) ON CONFLICT(guild_id, term, user_id) DO UPDATE SET "
+    "count = hits.count + excluded.count, last_seen = excluded.last_seen, user_name = excluded.user_name"
+)
+SQL_INSERT_MESSAGE = (
+    "INSERT INTO messages(guild_id, channel_id, user_id, user_name, message_id, term, content, created_at) "
+    "VALUES(?,?,?,?,?,?,?,?)"
+)
+SQL_UPSERT_COOLDOWN = (
+    "INSERT OR REPLACE INTO user_cooldowns(guild_id, user_id, term, last_increment) VALUES(?,?,?,?)"
+)
+SQL_UPSERT_DAILY = (
+    "INSERT INTO daily_stats(guild_id, date, term, total_mentions, unique_users) VALUES(?,?,?,?,?) "
+    "ON CONFLICT(guild_id, date, term) DO UPDATE SET "
+    "total_mentions = daily_stats.total_mentions + excluded.total_mentions, "
+    "unique_users = daily_stats.unique_users + excluded.unique_users"
+)
+
+# Trigram full-text index over messages.content for !search, kept in sync by triggers.
+# Separate from SCHEMA because not every SQLite build ships FTS5.
+FTS_SCHEMA = '''
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    content, content='messages', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF content ON messages BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content);
+END;
+'''
+
+# Tables keyed by their natural primary key; rows live in the key's B-tree with no rowid
+WITHOUT_ROWID_TABLES = (
+    "terms", "term_meta", "hits", "forbidden_phrases", "timeout_phrases",
+    "keyword_responses", "ignored_channels", "user_cooldowns", "daily_stats",
+)
+
+async def migrate_without_rowid(db: aiosqlite.Connection):
+    """Rebuild tables created before they were declared WITHOUT ROWID"""
+    stale = []
+    for table in WITHOUT_ROWID_TABLES:
+        async with db.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,)) as cur:
+            row = await cur.fetchone()
+        if row and "WITHOUT ROWID" not in row[0].upper():
+            stale.append(table)
+    if not stale:
+        return
+
+    log.info("Rebuilding %s table(s) as WITHOUT ROWID: %s", len(stale), stale)
+    # Dropping the old tables drops every index and trigger on them. SCHEMA recreates its
+    # own; anything added outside it is saved here and replayed after each rebuild.
+    schema_objects = set(re.findall(r"CREATE (?:INDEX|TRIGGER) IF NOT EXISTS (\w+)", SCHEMA))
+    extras = {}
+    for table in stale:
+        async with db.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type IN ('index', 'trigger') AND tbl_name=? AND sql IS NOT NULL",
+            (table,)
+        ) as cur:
+            extras[table] = [(name, sql) for name, sql in await cur.fetchall() if name not in schema_objects]
+    # Keep other tables' FOREIGN KEY clauses pointing at the original names across the rename
+    await db.execute("PRAGMA legacy_alter_table=ON")
+    await db.execute("BEGIN")
+    try:
+        for table in stale:
+            ddl = re.search(rf"CREATE TABLE IF NOT EXISTS {table} \(.*?\) WITHOUT ROWID;", SCHEMA, re.S).group(0)
+            async with db.execute(f"PRAGMA table_info({table})") as cur:
+                old_columns = [row[1] for row in await cur.fetchall()]
+            await db.execute(f"ALTER TABLE {table} RENAME TO {table}_rowid")
+            await db.execute(ddl)
+            async with db.execute(f"PRAGMA table_info({table})") as cur:
+                new_columns = {row[1] for row in await cur.fetchall()}
+            columns = ", ".join(c for c in old_columns if c in new_columns)
+            await db.execute(f"INSERT INTO {table}({columns}) SELECT {columns} FROM {table}_rowid")
+            await db.execute(f"DROP TABLE {table}_rowid")
+            for name, sql in extras[table]:
+                try:
+                    await db.execute(sql)
+                    log.info("Recreated %s on rebuilt table %s", name, table)
+                except aiosqlite.Error as e:
+                    log.warning("Dropped %s from rebuilt table %s, could not recreate it: %s", name, table, e)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        await db.execute("PRAGMA legacy_alter_table=OFF")
+
 async def init_db(db: aiosqlite.Connection):
-    for stmt in SCHEMA.strip().split(";"):
-        s = stmt.strip()
-        if s:
-            await db.execute(s)
-    
-    # Insert default achievements
-    for name, desc, req_type, req_val, emoji in DEFAULT_ACHIEVEMENTS:
+    await migrate_without_rowid(db)
+    async with db.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='user_totals'") as cur:
+        had_user_totals = await cur.fetchone() is not None
+    await db.executescript(SCHEMA)
+    if not had_user_totals:
+        # Seed the rollup from existing hits; the triggers keep it current from here on
         await db.execute(
-            "INSERT OR IGNORE INTO achievements (name, description, requirement_type, requirement_value, badge_emoji) VALUES (?,?,?,?,?)",
-            (name, desc, req_type, req_val, emoji)
+            "INSERT INTO user_totals(guild_id, user_id, user_name, total_count) "
+            "SELECT guild_id, user_id, user_name, SUM(count) FROM ("
+            "  SELECT guild_id, user_id, count, FIRST_VALUE(user_name) OVER ("
+            "    PARTITION BY guild_id, user_id ORDER BY last_seen DESC) AS user_name FROM hits"
+            ") GROUP BY guild_id, user_id HAVING SUM(count) > 0"
         )
     
+    # Insert default achievements
+    await db.executemany(
+        "INSERT OR IGNORE INTO achievements (name, description, requirement_type, requirement_value, badge_emoji) VALUES (?,?,?,?,?)",
+        DEFAULT_ACHIEVEMENTS
+    )
+    
     await db.commit()
 
 # -------------------------
@@ -230,18 +420,125 @@ async def init_db(db: aiosqlite.Connection):
 def normalize_term(term: str) -> str:
     return term.strip().lower()
 
-def build_patterns(terms: List[str], case_sensitive: bool = False) -> List[Tuple[str, re.Pattern]]:
-    flags = 0 if case_sensitive else re.IGNORECASE
-    patterns = []
+def _is_word_char(ch: str) -> bool:
+    """Mirror regex \\w so automaton matches keep \\b word-boundary semantics"""
+    return ch.isalnum() or ch == "_"
+
+# Guilds tracking at most this many terms are scanned with plain str.find,
+# which beats building and walking an automaton for a handful of literals
+FIND_SCAN_MAX_TERMS = 8
+
+def build_matcher(terms: List[str], case_sensitive: bool = False) -> Optional[Callable[[str], Counter]]:
+    """Build a scanner that finds every term in a single pass over a message"""
+    keys: Dict[str, str] = {}
     for term in terms:
-        # Use word boundaries for better matching
-        pattern = r'\b' + re.escape(term) + r'\b'
-        patterns.append((term, re.compile(pattern, flags)))
-    return patterns
+        key = term if case_sensitive else term.lower()
+        if key:
+            keys[key] = term
+    if not keys:
+        return None
+    return _compile_matcher(tuple(sorted(keys.items())))
+
+@lru_cache(maxsize=256)
+def _compile_matcher(items: Tuple[Tuple[str, str], ...]) -> Callable[[str], Counter]:
+    """Compile the scanner for a key set; guilds and rebuilds with the same keys share it"""
+    keys = dict(items)
+    if len(keys) <= FIND_SCAN_MAX_TERMS:
+        return partial(_scan_find, items)
+
+    if ahocorasick is None:
+        # One lookahead alternation reports every start position, so overlapping terms
+        # ("good game" and "game") both count. Two keys can only match at the same start
+        # when one is a prefix of the other, and the alternation reports just one of them;
+        # keys that prefix another (in sorted order, the next key) are counted on their own.
+        prefixed = tuple(a for a, b in zip(items, items[1:]) if b[0].startswith(a[0]))
+        alternation = _trie_pattern([k for k, term in items if (k, term) not in prefixed])
+        pattern = re.compile(r"(?=\b(" + alternation + r")\b)")
+        scan = partial(_scan_regex, pattern, keys, prefixed)
+    else:
+        automaton = ahocorasick.Automaton()
+        for key, term in keys.items():
+            automaton.add_word(key, (term, len(key)))
+        automaton.make_automaton()
+        scan = partial(_scan_automaton, automaton)
+    # Most chat messages contain no tracked term; skip the scan when none can start anywhere
+    return partial(_scan_prefiltered, frozenset(k[0] for k in keys), scan)
+
+def _trie_pattern(keys: List[str]) -> str:
+    """Alternation of keys factored by shared prefixes, so re tries one branch per character"""
+    trie: Dict[str, dict] = {}
+    for key in keys:
+        node = trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # a key ends here
+
+    def emit(node: dict) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        group = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{group})?" if "" in node else group
+
+    return emit(trie)
+
+def _is_whole_word(text: str, start: int, stop: int) -> bool:
+    """Check the \\b boundaries around text[start:stop]"""
+    before = text[start - 1] if start > 0 else ""
+    after = text[stop] if stop < len(text) else ""
+    return (_is_word_char(before) != _is_word_char(text[start])
+            and _is_word_char(after) != _is_word_char(text[stop - 1]))
+
+def _scan_find(keys: Tuple[Tuple[str, str], ...], text: str) -> Counter:
+    counts = Counter()
+    for key, term in keys:
+        i = text.find(key)
+        while i != -1:
+            if _is_whole_word(text, i, i + len(key)):
+                counts[term] += 1
+                i = text.find(key, i + len(key))
+            else:
+                i = text.find(key, i + 1)
+    return counts
+
+def _scan_regex(pattern: re.Pattern, keys: Dict[str, str], prefixed: Tuple[Tuple[str, str], ...], text: str) -> Counter:
+    """Count whole-word, non-overlapping occurrences of each term in one regex pass"""
+    counts = _scan_find(prefixed, text) if prefixed else Counter()
+    next_start: Dict[str, int] = {}
+    for m in pattern.finditer(text):
+        key = m.group(1)
+        term = keys[key]
+        start = m.start()
+        if start < next_start.get(term, 0):
+            continue  # overlaps the previous hit of the same term
+        counts[term] += 1
+        next_start[term] = start + len(key)
+    return counts
+
+def _scan_prefiltered(first_chars: frozenset, scan: Callable[[str], Counter], text: str) -> Counter:
+    if first_chars.isdisjoint(text):
+        return Counter()
+    return scan(text)
+
+def _scan_automaton(automaton, text: str) -> Counter:
+    """Count whole-word, non-overlapping occurrences of each term in text"""
+    counts = Counter()
+    next_start: Dict[str, int] = {}
+    for end, (term, length) in automaton.iter(text):
+        start = end - length + 1
+        if start < next_start.get(term, 0):
+            continue  # overlaps the previous hit of the same term
+        if _is_whole_word(text, start, end + 1):
+            counts[term] += 1
+            next_start[term] = end + 1
+    return counts
 
 def is_command_message(content: str, prefix: str) -> bool:
-    """Check if message starts with command prefix"""
-    return content.strip().startswith(prefix)
+    """Check if message starts with command prefix, ignoring leading whitespace"""
+    if content.startswith(prefix):
+        return True
+    # Only copy the string when there is leading whitespace to skip
+    return content[:1].isspace() and content.lstrip().startswith(prefix)
 
 def format_duration(seconds: int) -> str:
     """Format seconds into human readable duration"""
@@ -280,18 +577,39 @@ def admin_or_power(ctx: commands.Context) -> bool:
 # -------------------------
 # Migration (keeping existing logic)
 # -------------------------
+async def init_fts(db: aiosqlite.Connection) -> bool:
+    """Create the search index, backfilling it on first run; False if FTS5 is unavailable"""
+    async with db.execute("SELECT 1 FROM sqlite_master WHERE name='messages_fts'") as cur:
+        existed = await cur.fetchone() is not None
+    try:
+        await db.executescript(FTS_SCHEMA)
+    except aiosqlite.OperationalError as e:
+        log.warning("Full-text search unavailable, !search will scan messages: %s", e)
+        return False
+    if not existed:
+        log.info("Building the message search index...")
+        await db.execute("INSERT INTO messages_fts(messages_fts) VALUES('rebuild')")
+        await db.commit()
+    return True
+
 async def needs_migration(db: aiosqlite.Connection) -> bool:
-    async with db.execute("SELECT COUNT(*) FROM terms") as cur:
-        row = await cur.fetchone()
-        return (row[0] or 0) == 0
+    async with db.execute("SELECT 1 FROM terms LIMIT 1") as cur:
+        return (await cur.fetchone()) is None
+
+def _read_json(path: str) -> dict:
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
 
 async def migrate_json(db: aiosqlite.Connection):
     if not os.path.exists(JSON_PATH):
         log.info("No JSON file to migrate (%s not found).", JSON_PATH)
         return
     try:
-        with open(JSON_PATH, "r") as f:
-            data = json.load(f)
+        # Parse in a worker thread so a large file doesn't stall the gateway heartbeat
+        data = await asyncio.to_thread(_read_json, JSON_PATH)
     except Exception as e:
         log.warning("Failed to read %s: %s", JSON_PATH, e)
         return
@@ -301,47 +619,50 @@ async def migrate_json(db: aiosqlite.Connection):
 
     # Insert terms (guild_id=0 for global because JSON had no guilds)
     now = datetime.now(timezone.utc).isoformat()
-    for term in tracked_terms or term_data.keys():
-        norm = normalize_term(term)
-        await db.execute("INSERT OR IGNORE INTO terms(guild_id, term, created_at) VALUES(0, ?, ?)", (norm, now))
+    await db.executemany(
+        "INSERT OR IGNORE INTO terms(guild_id, term, created_at) VALUES(0, ?, ?)",
+        [(normalize_term(term), now) for term in tracked_terms or term_data.keys()]
+    )
 
     # Insert aggregates + per-user counts (guild_id=0)
+    meta_rows = []
+    hit_rows = []
     for term, info in term_data.items():
         norm = normalize_term(term)
         total = int(info.get("count", 0) or 0)
         last_mentioned = info.get("last_mentioned")
         last_user = info.get("last_user")
-        await db.execute(
-            "INSERT OR REPLACE INTO term_meta(guild_id, term, total_count, last_mentioned, last_user) VALUES(0,?,?,?,?)",
-            (norm, total, last_mentioned, last_user)
-        )
+        meta_rows.append((norm, total, last_mentioned, last_user))
         for user, cnt in (info.get("user_counts") or {}).items():
-            await db.execute(
-                "INSERT OR REPLACE INTO hits(guild_id, term, user_id, user_name, count, last_seen) VALUES(0,?,?,?,?,?)",
-                (norm, int(user), str(user), int(cnt or 0), last_mentioned)
-            )
-
+            hit_rows.append((norm, int(user), str(user), int(cnt or 0), last_mentioned))
+    await db.executemany(
+        "INSERT OR REPLACE INTO term_meta(guild_id, term, total_count, last_mentioned, last_user) VALUES(0,?,?,?,?)",
+        meta_rows
+    )
+    await db.executemany(
+        "INSERT INTO hits(guild_id, term, user_id, user_name, count, last_seen) VALUES(0,?,?,?,?,?) "
+        "ON CONFLICT(guild_id, term, user_id) DO UPDATE SET "
+        "user_name = excluded.user_name, count = excluded.count, last_seen = excluded.last_seen",
+        hit_rows
+    )
 
     # Persist forbidden phrases (guild_id=0)
-    for phrase in (data.get("forbidden_phrases") or []):
-        await db.execute(
-            "INSERT OR IGNORE INTO forbidden_phrases(guild_id, phrase) VALUES(0, ?)",
-            (normalize_term(phrase),)
-        )
+    await db.executemany(
+        "INSERT OR IGNORE INTO forbidden_phrases(guild_id, phrase) VALUES(0, ?)",
+        [(normalize_term(phrase),) for phrase in (data.get("forbidden_phrases") or [])]
+    )
 
     # Persist timeout phrases (guild_id=0)
-    for phrase in (data.get("timeout_phrases") or []):
-        await db.execute(
-            "INSERT OR IGNORE INTO timeout_phrases(guild_id, phrase) VALUES(0, ?)",
-            (normalize_term(phrase),)
-        )
+    await db.executemany(
+        "INSERT OR IGNORE INTO timeout_phrases(guild_id, phrase) VALUES(0, ?)",
+        [(normalize_term(phrase),) for phrase in (data.get("timeout_phrases") or [])]
+    )
 
     # Persist keyword responses (guild_id=0)
-    for k, v in (data.get("keyword_responses") or {}).items():
-        await db.execute(
-            "INSERT OR REPLACE INTO keyword_responses(guild_id, keyword, response) VALUES(0, ?, ?)",
-            (normalize_term(k), str(v))
-        )
+    await db.executemany(
+        "INSERT OR REPLACE INTO keyword_responses(guild_id, keyword, response) VALUES(0, ?, ?)",
+        [(normalize_term(k), str(v)) for k, v in (data.get("keyword_responses") or {}).items()]
+    )
 
     await db.commit()
     log.info("Migration from JSON complete. You can keep bot_data.json as a backup or delete it later.")
@@ -352,27 +673,98 @@ async def migrate_json(db: aiosqlite.Connection):
 class TermBot(commands.Bot):
     def __init__(self):
         super().__init__(command_prefix=COMMAND_PREFIX, intents=intents, help_command=None)
-        self.db: aiosqlite.Connection | None = None
-        self.patterns: Dict[int, List[Tuple[str, re.Pattern]]] = {}
+        self.db: aiosqlite.Connection | None = None  # the only connection that writes
+        self._readers: asyncio.Queue = asyncio.Queue()
+        self._write_queue: asyncio.Queue = asyncio.Queue(maxsize=WRITE_QUEUE_MAX)
+        self._writer_task: Optional[asyncio.Task] = None
+        self.write_lock = asyncio.Lock()  # held for each writer batch and each command's write sequence
+        self.patterns: Dict[int, Callable[[str], Counter]] = {}  # guild_id -> term scanner
+        self._shortest_key: Dict[int, int] = {}  # guild_id -> length of the shortest scanned term
         self.aliases: Dict[int, Dict[str, str]] = {}  # guild_id -> {alias: main_term}
+        self._term_cache: Optional[Dict[int, List[str]]] = None  # guild_id -> sorted terms
+        self._settings_cache: Dict[int, Dict] = {}  # guild_id -> settings dict
+        self._ignored_cache: Dict[int, Set[int]] = {}  # guild_id -> ignored channel ids
+        self._cooldowns: Dict[int, Dict[Tuple[int, str], float]] = {}  # guild_id -> {(user_id, term): epoch seconds}
+        self._progress: Dict[int, Dict[int, Counter]] = {}  # guild_id -> {user_id: per-term hit counts}
+        self._daily_users: Dict[int, Tuple[str, Set[Tuple[str, int]]]] = {}  # guild_id -> (date, {(term, user_id)})
+        self._achievement_thresholds: Dict[str, List[int]] = {}  # requirement type -> sorted values
+        self._cache_epoch = 0  # bumped on every invalidation; a load that overlaps one isn't cached
+        self.fts_enabled = False  # messages_fts exists and is kept in sync
 
     def _gid(self, message: discord.Message) -> int:
         return message.guild.id if message.guild else 0
 
     async def setup_hook(self) -> None:
-        self.db = await aiosqlite.connect(DB_PATH)
+        self.db = await aiosqlite.connect(DB_PATH, cached_statements=STATEMENT_CACHE_SIZE)
+        await apply_pragmas(self.db)
         await init_db(self.db)
+        self.fts_enabled = await init_fts(self.db)
         if await needs_migration(self.db):
             await migrate_json(self.db)
+        # Sampled statistics for the planner; analysis_limit keeps this quick on a large messages table
+        await self.db.execute("PRAGMA analysis_limit=400")
+        await self.db.execute("ANALYZE")
+        await self.db.commit()
+
+        # WAL lets read-only connections run command queries while the writer is busy
+        reader_uri = f"{Path(DB_PATH).resolve().as_uri()}?mode=ro"
+        for _ in range(DB_READERS):
+            reader = await aiosqlite.connect(reader_uri, uri=True, cached_statements=STATEMENT_CACHE_SIZE)
+            await apply_pragmas(reader)
+            self._readers.put_nowait(reader)
+
+        # Settings loads below go through the readers opened above
+        await self.load_achievement_thresholds()
         await self.refresh_patterns()
         
         # Start background tasks
+        self._writer_task = asyncio.create_task(self._flush_writes())
         self.cleanup_old_data.start()
         self.daily_summary_task.start()
 
+        # docker stop sends SIGTERM; cancel the run() task like Ctrl+C does so close() still
+        # flushes queued writes. Windows event loops have no signal handlers.
+        with contextlib.suppress(NotImplementedError):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+
+    @contextlib.asynccontextmanager
+    async def reader(self):
+        """Borrow a read-only connection from the pool"""
+        db = await self._readers.get()
+        try:
+            yield db
+        finally:
+            self._readers.put_nowait(db)
+
+    async def close(self):
+        await super().close()
+        if self._writer_task is not None and not self._writer_task.done():
+            await self._write_queue.put(None)  # flush whatever is queued, then stop
+            await self._writer_task
+        while not self._readers.empty():
+            await self._readers.get_nowait().close()
+        if self.db is not None:
+            await self.db.execute("PRAGMA optimize")
+            await self.db.close()
+
     async def get_guild_settings(self, guild_id: int) -> Dict:
-        """Get guild-specific settings"""
-        async with self.db.execute(
+        """Get guild-specific settings, cached until invalidate_settings()"""
+        settings = self._settings_cache.get(guild_id)
+        if settings is None:
+            epoch = self._cache_epoch
+            settings = await self._load_guild_settings(guild_id)
+            if epoch == self._cache_epoch:
+                self._settings_cache[guild_id] = settings
+        return settings
+
+    def invalidate_settings(self, guild_id: int):
+        """Drop a guild's cached settings and ignored channels after they change"""
+        self._cache_epoch += 1
+        self._settings_cache.pop(guild_id, None)
+        self._ignored_cache.pop(guild_id, None)
+
+    async def _load_guild_settings(self, guild_id: int) -> Dict:
+        async with self.reader() as db, db.execute(
             "SELECT ignore_commands, case_sensitive, min_word_length, cooldown_seconds, auto_cleanup_days, notification_channel, daily_summary, theme_color FROM guild_settings WHERE guild_id=?", 
             (guild_id,)
         ) as cur:
@@ -407,35 +799,106 @@ class TermBot(commands.Bot):
         term = normalize_term(term)
         return self.aliases.get(guild_id, {}).get(term, term)
 
+    async def get_terms(self) -> Dict[int, List[str]]:
+        """Tracked terms per guild, loaded once and reused until invalidated"""
+        if self._term_cache is None:
+            cache: Dict[int, List[str]] = {}
+            async with self.db.execute("SELECT guild_id, term FROM terms ORDER BY guild_id, term") as cur:
+                for gid, term in await cur.fetchall():
+                    cache.setdefault(gid, []).append(term)
+            self._term_cache = cache
+        return self._term_cache
+
+    def invalidate_terms(self):
+        """Drop the cached term lists after terms are added or removed"""
+        self._term_cache = None
+
+    async def add_cached_term(self, guild_id: int, term: str):
+        """Record a newly tracked term and rebuild only that guild's scanner"""
+        terms = (await self.get_terms()).setdefault(guild_id, [])
+        if term not in terms:
+            bisect.insort(terms, term)
+        await self.refresh_guild_patterns(guild_id)
+
+    async def remove_cached_term(self, guild_id: int, term: str):
+        """Forget an untracked term and its aliases, then rebuild that guild's scanner"""
+        terms = (await self.get_terms()).get(guild_id, [])
+        if term in terms:
+            terms.remove(term)
+        aliases = self.aliases.get(guild_id, {})
+        for alias in [a for a, main in aliases.items() if main == term]:
+            del aliases[alias]
+        await self.refresh_guild_patterns(guild_id)
+
+    async def refresh_guild_patterns(self, guild_id: int):
+        """Rebuild the term scanner for one guild from the cached terms and aliases"""
+        terms = (await self.get_terms()).get(guild_id)
+        scanner = None
+        if terms:
+            settings = await self.get_guild_settings(guild_id)
+            # Filter terms by minimum length
+            filtered_terms = [t for t in terms if len(t) >= settings['min_word_length']]
+            # Add aliases to patterns
+            filtered_terms.extend(self.aliases.get(guild_id, {}).keys())
+            scanner = build_matcher(filtered_terms, settings['case_sensitive'])
+        if scanner is not None:
+            self.patterns[guild_id] = scanner
+            self._shortest_key[guild_id] = min(len(t) for t in filtered_terms)
+        else:
+            self.patterns.pop(guild_id, None)
+            self._shortest_key.pop(guild_id, None)
+
     async def refresh_patterns(self):
-        """Refresh regex patterns and aliases for all guilds"""
+        """Refresh term scanners and aliases for all guilds"""
         self.patterns.clear()
+        self._shortest_key.clear()
         self.aliases.clear()
         
         # Load aliases
         async with self.db.execute("SELECT guild_id, alias, main_term FROM term_aliases") as cur:
-            async for gid, alias, main_term in cur:
-                if gid not in self.aliases:
-                    self.aliases[gid] = {}
-                self.aliases[gid][alias] = main_term
-        
-        # Load all guild/term pairs
-        async with self.db.execute("SELECT guild_id, term FROM terms ORDER BY guild_id, term") as cur:
             rows = await cur.fetchall()
-        from collections import defaultdict
-        tmp = defaultdict(list)
-        for gid, term in rows:
-            tmp[gid].append(term)
+        for gid, alias, main_term in rows:
+            if gid not in self.aliases:
+                self.aliases[gid] = {}
+            self.aliases[gid][alias] = main_term
         
         # Build patterns for each guild with their settings
-        for gid, terms in tmp.items():
-            settings = await self.get_guild_settings(gid)
-            # Filter terms by minimum length
-            filtered_terms = [t for t in terms if len(t) >= settings['min_word_length']]
-            # Add aliases to patterns
-            if gid in self.aliases:
-                filtered_terms.extend(self.aliases[gid].keys())
-            self.patterns[gid] = build_patterns(filtered_terms, settings['case_sensitive'])
+        for gid in await self.get_terms():
+            await self.refresh_guild_patterns(gid)
+
+    async def load_achievement_thresholds(self):
+        """Index achievement requirements by type so the writer can tell when one may be reached"""
+        async with self.db.execute("SELECT requirement_type, requirement_value FROM achievements") as cur:
+            rows = await cur.fetchall()
+        thresholds: Dict[str, List[int]] = {}
+        for req_type, req_value in rows:
+            if req_type == "first_mention":
+                req_type, req_value = "total_mentions", 1
+            thresholds.setdefault(req_type, []).append(req_value or 0)
+        for values in thresholds.values():
+            values.sort()
+        self._achievement_thresholds = thresholds
+
+    async def reached_threshold(self, guild_id: int, user_id: int, gained: Counter) -> bool:
+        """Add a committed batch's matches to the user's progress; True if an achievement may now be earned"""
+        progress = self._progress.setdefault(guild_id, {})
+        counts = progress.get(user_id)
+        if counts is None:
+            # First batch for this user since startup: load committed counts (this batch included) and check once
+            async with self.reader() as db, db.execute(
+                "SELECT term, count FROM hits WHERE guild_id=? AND user_id=?", (guild_id, user_id)
+            ) as cur:
+                progress[user_id] = Counter({term: count or 0 for term, count in await cur.fetchall()})
+            return True
+
+        before = (sum(counts.values()), len(counts), max(counts.values(), default=0))
+        counts.update(gained)
+        after = (sum(counts.values()), len(counts), max(counts.values(), default=0))
+        for req_type, old, new in zip(("total_mentions", "unique_terms", "term_mentions"), before, after):
+            values = self._achievement_thresholds.get(req_type, ())
+            if bisect.bisect_right(values, old) < bisect.bisect_right(values, new):
+                return True
+        return False
 
     async def check_achievements(self, guild_id: int, user_id: int):
         """Check and award achievements for user"""
@@ -454,6 +917,7 @@ class TermBot(commands.Bot):
             achievements = await cur.fetchall()
         
         new_achievements = []
+        earned_rows = []
         for ach_id, name, req_type, req_value, emoji in achievements:
             # Check if user already has this achievement
             async with self.db.execute(
@@ -482,14 +946,17 @@ class TermBot(commands.Bot):
             
             if earned:
                 now = datetime.now(timezone.utc).isoformat()
-                await self.db.execute(
-                    "INSERT INTO user_achievements(guild_id, user_id, achievement_id, earned_at) VALUES(?,?,?,?)",
-                    (guild_id, user_id, ach_id, now)
-                )
+                earned_rows.append((guild_id, user_id, ach_id, now))
                 new_achievements.append((name, emoji))
         
-        if new_achievements:
-            await self.db.commit()
+        if earned_rows:
+            # OR IGNORE: a concurrent check for the same user may have awarded it first
+            async with self.write_lock:
+                await self.db.executemany(
+                    "INSERT OR IGNORE INTO user_achievements(guild_id, user_id, achievement_id, earned_at) VALUES(?,?,?,?)",
+                    earned_rows
+                )
+                await self.db.commit()
         
         return new_achievements
 
@@ -497,7 +964,9 @@ class TermBot(commands.Bot):
     async def cleanup_old_data(self):
         """Clean up old data based on guild settings"""
         async with self.db.execute("SELECT guild_id, auto_cleanup_days FROM guild_settings WHERE auto_cleanup_days > 0") as cur:
-            async for guild_id, days in cur:
+            rows = await cur.fetchall()
+        async with self.write_lock:
+            for guild_id, days in rows:
                 cutoff = datetime.now(timezone.utc) - timedelta(days=days)
                 cutoff_str = cutoff.isoformat()
                 
@@ -506,142 +975,195 @@ class TermBot(commands.Bot):
                     "DELETE FROM messages WHERE guild_id=? AND created_at < ?",
                     (guild_id, cutoff_str)
                 )
-        
-        await self.db.commit()
+            
+            await self.db.commit()
 
     @tasks.loop(time=time(hour=9, minute=0, tzinfo=timezone.utc))  # 9 AM UTC daily
     async def daily_summary_task(self):
         """Send daily summaries to guilds that have it enabled"""
         yesterday = datetime.now(timezone.utc) - timedelta(days=1)
         yesterday_str = yesterday.strftime("%Y-%m-%d")
+        today_str = (yesterday + timedelta(days=1)).strftime("%Y-%m-%d")
         
         async with self.db.execute(
             "SELECT guild_id, notification_channel, theme_color FROM guild_settings WHERE daily_summary=1 AND notification_channel IS NOT NULL"
         ) as cur:
-            async for guild_id, channel_id, theme_color in cur:
-                guild = self.get_guild(guild_id)
-                if not guild:
-                    continue
-                    
-                channel = guild.get_channel(channel_id)
-                if not channel:
-                    continue
-                
-                # Get yesterday's stats
-                async with self.db.execute(
-                    "SELECT term, COUNT(*) as mentions, COUNT(DISTINCT user_id) as users FROM messages WHERE guild_id=? AND DATE(created_at) = ? GROUP BY term ORDER BY mentions DESC LIMIT 5",
-                    (guild_id, yesterday_str)
-                ) as stats_cur:
-                    top_terms = await stats_cur.fetchall()
-                
-                if not top_terms:
-                    continue
-                
-                embed = discord.Embed(
-                    title=f"Daily Summary - {yesterday.strftime('%B %d, %Y')}",
-                    color=theme_color,
-                    timestamp=yesterday
-                )
-                
-                summary = "\n".join([f"**{term}** - {mentions} mentions by {users} users" for term, mentions, users in top_terms])
-                embed.add_field(name="Top Terms", value=summary, inline=False)
-                
-                try:
-                    await channel.send(embed=embed)
-                except discord.HTTPException:
-                    pass  # Channel might not be accessible
+            rows = await cur.fetchall()
+        for guild_id, channel_id, theme_color in rows:
+            guild = self.get_guild(guild_id)
+            if not guild:
+                continue
+
+            channel = guild.get_channel(channel_id)
+            if not channel:
+                continue
+
+            # Get yesterday's stats
+            async with self.db.execute(
+                "SELECT term, COUNT(*) as mentions, COUNT(DISTINCT user_id) as users FROM messages WHERE guild_id=? AND created_at >= ? AND created_at < ? GROUP BY term ORDER BY mentions DESC LIMIT 5",
+                (guild_id, yesterday_str, today_str)
+            ) as stats_cur:
+                top_terms = await stats_cur.fetchall()
+
+            if not top_terms:
+                continue
+
+            embed = discord.Embed(
+                title=f"Daily Summary - {yesterday.strftime('%B %d, %Y')}",
+                color=theme_color,
+                timestamp=yesterday
+            )
+
+            summary = "\n".join([f"**{term}** - {mentions} mentions by {users} users" for term, mentions, users in top_terms])
+            embed.add_field(name="Top Terms", value=summary, inline=False)
+
+            try:
+                await channel.send(embed=embed)
+            except discord.HTTPException:
+                pass  # Channel might not be accessible
 
     async def is_channel_ignored(self, guild_id: int, channel_id: int) -> bool:
         """Check if channel should be ignored"""
-        async with self.db.execute(
-            "SELECT 1 FROM ignored_channels WHERE guild_id=? AND channel_id=?", 
-            (guild_id, channel_id)
-        ) as cur:
-            return await cur.fetchone() is not None
+        ignored = self._ignored_cache.get(guild_id)
+        if ignored is None:
+            epoch = self._cache_epoch
+            async with self.reader() as db, db.execute(
+                "SELECT channel_id FROM ignored_channels WHERE guild_id=?", (guild_id,)
+            ) as cur:
+                ignored = {row[0] for row in await cur.fetchall()}
+            if epoch == self._cache_epoch:
+                self._ignored_cache[guild_id] = ignored
+        return channel_id in ignored
 
-    async def check_cooldown(self, guild_id: int, user_id: int, term: str, cooldown_seconds: int) -> bool:
+    async def check_cooldown(self, guild_id: int, user_id: int, term: str, cooldown_seconds: int, now: datetime) -> bool:
         """Check if user is on cooldown for this term"""
         if cooldown_seconds <= 0:
             return False
-            
-        async with self.db.execute(
-            "SELECT last_increment FROM user_cooldowns WHERE guild_id=? AND user_id=? AND term=?",
-            (guild_id, user_id, term)
-        ) as cur:
-            row = await cur.fetchone()
-            
-        if not row:
-            return False
-            
-        last_time = datetime.fromisoformat(row[0])
-        now = datetime.now(timezone.utc)
-        return (now - last_time).total_seconds() < cooldown_seconds
-
-    async def update_cooldown(self, guild_id: int, user_id: int, term: str):
-        """Update user's cooldown for this term"""
-        now = datetime.now(timezone.utc).isoformat()
-        await self.db.execute(
-            "INSERT OR REPLACE INTO user_cooldowns(guild_id, user_id, term, last_increment) VALUES(?,?,?,?)",
-            (guild_id, user_id, term, now)
-        )
 
-    async def increment(self, message: discord.Message, term: str, occurrences: int = 1):
-        """Enhanced increment with weekly/monthly tracking and achievements"""
-        gid = self._gid(message)
-        original_term = term
-        term = await self.resolve_term(gid, normalize_term(term))
-        now = datetime.now(timezone.utc).isoformat()
-        user_id = int(message.author.id)
-        user_name = str(message.author)
+        cooldowns = self._cooldowns.get(guild_id)
+        if cooldowns is None:
+            # First cooldown check for this guild: load its persisted cooldowns once
+            epoch = self._cache_epoch
+            async with self.reader() as db, db.execute(
+                "SELECT user_id, term, last_increment FROM user_cooldowns WHERE guild_id=?", (guild_id,)
+            ) as cur:
+                rows = await cur.fetchall()
+            if epoch == self._cache_epoch:
+                cooldowns = self._cooldowns.setdefault(guild_id, {})  # a concurrent check may have loaded it already
+            else:
+                cooldowns = {}  # a reset raced this load; use it once and reload next time
+            for uid, t, last in rows:
+                if last:
+                    stamp = datetime.fromisoformat(last).timestamp()
+                    cooldowns[(uid, t)] = max(stamp, cooldowns.get((uid, t), stamp))
+
+        last_time = cooldowns.get((user_id, term))
+        return last_time is not None and now.timestamp() - last_time < cooldown_seconds
+
+    def update_cooldown(self, guild_id: int, user_id: int, term: str, now: datetime):
+        """Update user's cooldown for this term; the writer persists it with the message's hits"""
+        cooldowns = self._cooldowns.get(guild_id)
+        if cooldowns is not None:
+            cooldowns[(user_id, term)] = now.timestamp()
+
+    def invalidate_user_state(self, guild_id: int):
+        """Drop a guild's cooldowns, achievement progress and daily users after its hit rows are deleted"""
+        self._cache_epoch += 1
+        self._cooldowns.pop(guild_id, None)
+        self._progress.pop(guild_id, None)
+        self._daily_users.pop(guild_id, None)
+
+    async def increment(self, message: discord.Message, gid: int, user_id: int, matches: Dict[str, int], now: str):
+        """Queue every matched term of a message for the background writer"""
+        # Waits only when the writer has fallen WRITE_QUEUE_MAX messages behind
+        await self._write_queue.put((
+            gid, message.channel.id, user_id, str(message.author),
+            message.id, message.content, now, matches
+        ))
+
+    async def _flush_writes(self):
+        """Drain queued message hits and commit them in batches"""
+        while True:
+            batch = [await self._write_queue.get()]
+            await asyncio.sleep(WRITE_BATCH_WAIT)
+            while len(batch) < WRITE_BATCH_MAX and not self._write_queue.empty():
+                batch.append(self._write_queue.get_nowait())
+
+            records = [r for r in batch if r is not None]
+            if records:
+                async with self.write_lock:
+                    try:
+                        await self._write_hits(records)
+                    except Exception:
+                        log.exception("Failed to write %s queued message(s)", len(records))
+                        self._daily_users.clear()  # the lost batch may have marked users as counted
+                        try:
+                            await self.db.rollback()
+                        except Exception:
+                            log.exception("Rollback after a failed write batch failed")
+            if len(records) < len(batch):
+                return  # close() asked us to stop
+
+    async def daily_users(self, guild_id: int, today: str) -> Set[Tuple[str, int]]:
+        """(term, user_id) pairs already counted in a guild's daily_stats.unique_users for today"""
+        entry = self._daily_users.get(guild_id)
+        if entry is None or entry[0] != today:
+            # First hit of the day or since startup: recover who has been counted from today's messages
+            async with self.reader() as db, db.execute(
+                "SELECT DISTINCT term, user_id FROM messages WHERE guild_id=? AND created_at >= ?", (guild_id, today)
+            ) as cur:
+                entry = self._daily_users[guild_id] = (today, set(await cur.fetchall()))
+        return entry[1]
+
+    async def _write_hits(self, records: List[tuple]):
+        """Write a batch of queued messages with one executemany per table and one commit"""
+        meta_rows = []
+        hit_rows = []
+        message_rows = []
+        cooldown_rows = []
+        daily_rows = []
+        gains: Dict[Tuple[int, int], Counter] = {}
+        for gid, channel_id, user_id, user_name, message_id, content, now, matches in records:
+            gains.setdefault((gid, user_id), Counter()).update(matches)
+            today = now[:10]  # UTC ISO timestamp starts with YYYY-MM-DD
+            counted = await self.daily_users(gid, today)
+            for term, occurrences in matches.items():
+                meta_rows.append((gid, term, occurrences, now, user_name))
+                hit_rows.append((gid, term, user_id, user_name, occurrences, now))
+                message_rows.append((gid, channel_id, user_id, user_name, message_id, term, content, now))
+                cooldown_rows.append((gid, user_id, term, now))
+                new_user = (term, user_id) not in counted
+                if new_user:
+                    counted.add((term, user_id))
+                daily_rows.append((gid, today, term, occurrences, int(new_user)))
 
         # Update main counters
-        await self.db.execute(
-            "INSERT INTO term_meta(guild_id, term, total_count, last_mentioned, last_user) "
-            "VALUES(?,?,?,?,?) ON CONFLICT(guild_id, term) DO UPDATE SET "
-            "total_count = term_meta.total_count + excluded.total_count, "
-            "last_mentioned = excluded.last_mentioned, last_user = excluded.last_user",
-            (gid, term, occurrences, now, user_name)
-        )
-        
-        await self.db.execute(
-            "INSERT INTO hits(guild_id, term, user_id, user_name, count, last_seen) "
-            "VALUES(?,?,?,?,?,?) ON CONFLICT(guild_id, term, user_id) DO UPDATE SET "
-            "count = hits.count + excluded.count, last_seen = excluded.last_seen, user_name = excluded.user_name",
-            (gid, term, user_id, user_name, occurrences, now)
-        )
-        
-        await self.db.execute(
-            "INSERT INTO messages(guild_id, channel_id, user_id, user_name, message_id, term, content, created_at) "
-            "VALUES(?,?,?,?,?,?,?,?)",
-            (gid, message.channel.id, user_id, user_name, message.id, term, message.content, now)
-        )
+        await self.db.executemany(SQL_UPSERT_META, meta_rows)
+        await self.db.executemany(SQL_UPSERT_HIT, hit_rows)
+        await self.db.executemany(SQL_INSERT_MESSAGE, message_rows)
+        await self.db.executemany(SQL_UPSERT_COOLDOWN, cooldown_rows)
 
         # Update daily stats
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        await self.db.execute(
-            "INSERT INTO daily_stats(guild_id, date, term, total_mentions, unique_users) VALUES(?,?,?,?,1) "
-            "ON CONFLICT(guild_id, date, term) DO UPDATE SET "
-            "total_mentions = daily_stats.total_mentions + excluded.total_mentions",
-            (gid, today, term, occurrences)
-        )
+        await self.db.executemany(SQL_UPSERT_DAILY, daily_rows)
+
+        await self.db.commit()
 
-        # Check for achievements (async, don't await to avoid slowing down message processing)
-        asyncio.create_task(self.check_achievements(gid, user_id))
+        # Check achievements only for users whose committed counts crossed a requirement
+        for (gid, user_id), gained in gains.items():
+            if await self.reached_threshold(gid, user_id, gained):
+                asyncio.create_task(self.check_achievements(gid, user_id))
 
     async def on_ready(self):
         log.info("Logged in as %s (%s)", self.user, self.user.id)
         log.info("Connected to %s guild(s): %s", len(self.guilds), [g.name for g in self.guilds])
         
-        # Get database stats
-        async with self.db.execute("SELECT COUNT(*) FROM terms") as cur:
-            total_terms = (await cur.fetchone())[0]
-        
-        async with self.db.execute("SELECT COUNT(DISTINCT guild_id) FROM terms WHERE guild_id != 0") as cur:
-            active_guilds = (await cur.fetchone())[0]
+        # Get database stats from the cached term lists; on_ready fires again on every reconnect
+        terms = await self.get_terms()
+        total_terms = sum(len(t) for t in terms.values())
+        active_guilds = sum(1 for gid, t in terms.items() if gid != 0 and t)
             
         # Check for legacy data (guild_id = 0)
-        async with self.db.execute("SELECT COUNT(*) FROM terms WHERE guild_id = 0") as cur:
-            legacy_terms = (await cur.fetchone())[0]
+        legacy_terms = len(terms.get(0, []))
         
         if legacy_terms > 0:
             log.info("Found %s legacy term(s) from migration (guild_id=0)", legacy_terms)
@@ -656,25 +1178,29 @@ class TermBot(commands.Bot):
         current_guild_ids = {g.id for g in self.guilds}
         
         # Find guilds in database that bot is no longer in
-        async with self.db.execute("SELECT DISTINCT guild_id FROM terms WHERE guild_id != 0") as cur:
-            db_guild_ids = {row[0] for row in await cur.fetchall()}
+        db_guild_ids = {gid for gid, t in (await self.get_terms()).items() if gid != 0 and t}
         
         orphaned = db_guild_ids - current_guild_ids
         
         if orphaned:
             log.info("Cleaning up data for %s orphaned guild(s): %s", len(orphaned), list(orphaned))
-            for gid in orphaned:
-                # Clean up all tables
-                tables = ["terms", "term_meta", "hits", "messages", "guild_settings", 
-                         "ignored_channels", "user_cooldowns", "forbidden_phrases", 
-                         "timeout_phrases", "keyword_responses", "term_categories",
-                         "term_category_assignments", "user_achievements", "daily_stats",
-                         "term_aliases", "user_preferences"]
-                
-                for table in tables:
-                    await self.db.execute(f"DELETE FROM {table} WHERE guild_id = ?", (gid,))
+            # Clean up all tables
+            tables = ["terms", "term_meta", "hits", "messages", "guild_settings", 
+                     "ignored_channels", "user_cooldowns", "forbidden_phrases", 
+                     "timeout_phrases", "keyword_responses", "term_categories",
+                     "term_category_assignments", "user_achievements", "daily_stats",
+                     "term_aliases", "user_preferences"]
+            rows = [(gid,) for gid in orphaned]
             
-            await self.db.commit()
+            # One statement per table; the commit below makes the whole cleanup one transaction
+            async with self.write_lock:
+                for table in tables:
+                    await self.db.executemany(f"DELETE FROM {table} WHERE guild_id = ?", rows)
+                await self.db.commit()
+                for gid in orphaned:
+                    self.invalidate_settings(gid)
+                    self.invalidate_user_state(gid)
+            self.invalidate_terms()
             await self.refresh_patterns()
 
     async def on_message(self, message: discord.Message):
@@ -685,37 +1211,49 @@ class TermBot(commands.Bot):
         if not content:
             return
 
-        gid = message.guild.id if message.guild else 0
-        
-        # Check if channel is ignored
-        if await self.is_channel_ignored(gid, message.channel.id):
+        gid = self._gid(message)
+
+        # Most guilds track nothing; skip the channel and settings lookups for them
+        scanner = self.patterns.get(gid)
+        if scanner is None:
             await self.process_commands(message)
             return
+        shortest = self._shortest_key[gid]
         
         # Get guild settings
         settings = await self.get_guild_settings(gid)
         
-        # Skip if it's a command and ignore_commands is enabled
+        # Skip if it's a command and ignore_commands is enabled; cheaper than the channel lookup
         if settings['ignore_commands'] and is_command_message(content, COMMAND_PREFIX):
             await self.process_commands(message)
             return
 
-        pats = self.patterns.get(gid, [])
-        matched_terms = []
-        
-        for term, pat in pats:
-            matches = pat.findall(content)  # Find all occurrences
-            if matches:
+        # Check if channel is ignored
+        if await self.is_channel_ignored(gid, message.channel.id):
+            await self.process_commands(message)
+            return
+
+        matched_terms: Dict[str, int] = {}
+        text = content if settings['case_sensitive'] else content.lower()
+        
+        # Too short to contain even the shortest term
+        if len(text) >= shortest:
+            # One pass over the message finds every tracked term and alias
+            now = datetime.now(timezone.utc)
+            stamp = now.isoformat()  # shared by every row this message writes
+            user_id = int(message.author.id)
+            hits = Counter()
+            for term, count in scanner(text).items():
+                hits[await self.resolve_term(gid, term)] += count  # aliases fold into their main term
+            for term, count in hits.items():
                 # Check cooldown
-                resolved_term = await self.resolve_term(gid, term)
-                if not await self.check_cooldown(gid, message.author.id, resolved_term, settings['cooldown_seconds']):
-                    count = len(matches)
-                    await self.increment(message, term, occurrences=count)
-                    await self.update_cooldown(gid, message.author.id, resolved_term)
-                    matched_terms.append((resolved_term, count))
+                if not await self.check_cooldown(gid, user_id, term, settings['cooldown_seconds'], now):
+                    self.update_cooldown(gid, user_id, term, now)
+                    matched_terms[term] = count
 
         if matched_terms:
-            await self.db.commit()
+            # The background writer commits these; don't hold up command handling on disk I/O
+            await self.increment(message, gid, user_id, matched_terms, stamp)
             log.debug("Matched terms in message %s: %s", message.id, matched_terms)
 
         await self.process_commands(message)
@@ -735,7 +1273,7 @@ async def cmd_terms(ctx: commands.Context, category: str = None):
     if category:
         # Show terms in specific category
         category = normalize_term(category)
-        async with bot.db.execute(
+        async with bot.reader() as db, db.execute(
             """SELECT t.term, tm.total_count FROM terms t 
                LEFT JOIN term_meta tm ON t.guild_id = tm.guild_id AND t.term = tm.term
                JOIN term_category_assignments tca ON t.guild_id = tca.guild_id AND t.term = tca.term
@@ -754,7 +1292,7 @@ async def cmd_terms(ctx: commands.Context, category: str = None):
         )
     else:
         # Show all terms with their categories
-        async with bot.db.execute(
+        async with bot.reader() as db, db.execute(
             """SELECT t.term, tm.total_count, tca.category_name FROM terms t 
                LEFT JOIN term_meta tm ON t.guild_id = tm.guild_id AND t.term = tm.term
                LEFT JOIN term_category_assignments tca ON t.guild_id = tca.guild_id AND t.term = tca.term
@@ -782,16 +1320,19 @@ async def cmd_terms(ctx: commands.Context, category: str = None):
     # Split into chunks if too long
     terms_str = ", ".join(terms_text)
     if len(terms_str) > 1900:
+        # Collect each chunk's terms in a list and join once, instead of growing a string
         chunks = []
-        current_chunk = ""
+        current_chunk = []
+        current_len = 0
         for term_str in terms_text:
-            if len(current_chunk + term_str + ", ") > 1900:
-                chunks.append(current_chunk.rstrip(", "))
-                current_chunk = term_str + ", "
-            else:
-                current_chunk += term_str + ", "
-        if current_chunk.strip():
-            chunks.append(current_chunk.rstrip(", "))
+            if current_chunk and current_len + len(term_str) + 2 > 1900:
+                chunks.append(", ".join(current_chunk))
+                current_chunk = []
+                current_len = 0
+            current_chunk.append(term_str)
+            current_len += len(term_str) + 2
+        if current_chunk:
+            chunks.append(", ".join(current_chunk))
         
         for i, chunk in enumerate(chunks):
             if i == 0:
@@ -828,10 +1369,11 @@ async def cmd_track(ctx: commands.Context, *, term: str):
         return
     
     now = datetime.now(timezone.utc).isoformat()
-    await bot.db.execute("INSERT OR IGNORE INTO terms(guild_id, term, created_by, created_at) VALUES(?, ?, ?, ?)", 
-                         (gid, term, ctx.author.id, now))
-    await bot.db.commit()
-    await bot.refresh_patterns()
+    async with bot.write_lock:
+        await bot.db.execute("INSERT OR IGNORE INTO terms(guild_id, term, created_by, created_at) VALUES(?, ?, ?, ?)", 
+                             (gid, term, ctx.author.id, now))
+        await bot.db.commit()
+    await bot.add_cached_term(gid, term)
     
     embed = discord.Embed(
         title="Term Added",
@@ -860,13 +1402,16 @@ async def cmd_untrack(ctx: commands.Context, *, term: str):
     
     # Delete from all related tables
     tables = ["terms", "term_meta", "hits", "messages", "user_cooldowns", 
-              "term_category_assignments", "term_aliases", "daily_stats"]
-    
-    for table in tables:
-        await bot.db.execute(f"DELETE FROM {table} WHERE guild_id=? AND term=?", (gid, term))
+              "term_category_assignments", "daily_stats"]
     
-    await bot.db.commit()
-    await bot.refresh_patterns()
+    async with bot.write_lock:
+        for table in tables:
+            await bot.db.execute(f"DELETE FROM {table} WHERE guild_id=? AND term=?", (gid, term))
+        await bot.db.execute("DELETE FROM term_aliases WHERE guild_id=? AND main_term=?", (gid, term))
+        
+        await bot.db.commit()
+        bot.invalidate_user_state(gid)
+    await bot.remove_cached_term(gid, term)
     
     settings = await bot.get_guild_settings(gid)
     embed = discord.Embed(
@@ -887,7 +1432,7 @@ async def cmd_stats(ctx: commands.Context, *, term: str = None):
         term = await bot.resolve_term(gid, normalize_term(term))
         
         # Get comprehensive stats
-        async with bot.db.execute(
+        async with bot.reader() as db, db.execute(
             "SELECT total_count, last_mentioned, last_user FROM term_meta WHERE guild_id=? AND term=?", 
             (gid, term)
         ) as cur:
@@ -903,20 +1448,20 @@ async def cmd_stats(ctx: commands.Context, *, term: str = None):
         week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
         day_ago = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
         
-        async with bot.db.execute(
+        async with bot.reader() as db, db.execute(
             "SELECT COUNT(*) FROM messages WHERE guild_id=? AND term=? AND created_at >= ?",
             (gid, term, week_ago)
         ) as cur:
             weekly_count = (await cur.fetchone())[0]
             
-        async with bot.db.execute(
+        async with bot.reader() as db, db.execute(
             "SELECT COUNT(*) FROM messages WHERE guild_id=? AND term=? AND created_at >= ?",
             (gid, term, day_ago)
         ) as cur:
             daily_count = (await cur.fetchone())[0]
         
         # Get top users
-        async with bot.db.execute(
+        async with bot.reader() as db, db.execute(
             "SELECT user_name, count, last_seen FROM hits WHERE guild_id=? AND term=? ORDER BY count DESC LIMIT 10", 
             (gid, term)
         ) as cur:
@@ -948,7 +1493,7 @@ async def cmd_stats(ctx: commands.Context, *, term: str = None):
         await ctx.send(embed=embed)
     else:
         # Show overview of all terms
-        async with bot.db.execute(
+        async with bot.reader() as db, db.execute(
             "SELECT term, total_count FROM term_meta WHERE guild_id=? ORDER BY total_count DESC LIMIT 15", 
             (gid,)
         ) as cur:
@@ -980,7 +1525,7 @@ async def cmd_achievements(ctx: commands.Context, user: discord.Member = None):
     settings = await bot.get_guild_settings(gid)
     
     # Get user's achievements
-    async with bot.db.execute(
+    async with bot.reader() as db, db.execute(
         """SELECT a.name, a.description, a.badge_emoji, ua.earned_at 
            FROM user_achievements ua 
            JOIN achievements a ON ua.achievement_id = a.id 
@@ -1010,7 +1555,7 @@ async def cmd_achievements(ctx: commands.Context, user: discord.Member = None):
         embed.description = "No achievements yet! Start mentioning tracked terms to earn some."
     
     # Show progress towards next achievements
-    async with bot.db.execute(
+    async with bot.reader() as db, db.execute(
         "SELECT COUNT(DISTINCT term), SUM(count) FROM hits WHERE guild_id=? AND user_id=?",
         (gid, target_user.id)
     ) as cur:
@@ -1034,7 +1579,7 @@ async def cmd_category(ctx: commands.Context, action: str = None, *, args: str =
     
     if not action:
         # List all categories
-        async with bot.db.execute(
+        async with bot.reader() as db, db.execute(
             "SELECT category_name, description, COUNT(tca.term) as term_count FROM term_categories tc "
             "LEFT JOIN term_category_assignments tca ON tc.guild_id = tca.guild_id AND tc.category_name = tca.category_name "
             "WHERE tc.guild_id=? GROUP BY tc.category_name ORDER BY tc.category_name", 
@@ -1063,11 +1608,12 @@ async def cmd_category(ctx: commands.Context, action: str = None, *, args: str =
         name = normalize_term(parts[0])
         description = parts[1] if len(parts) > 1 else None
         
-        await bot.db.execute(
-            "INSERT OR IGNORE INTO term_categories(guild_id, category_name, description) VALUES(?,?,?)",
-            (gid, name, description)
-        )
-        await bot.db.commit()
+        async with bot.write_lock:
+            await bot.db.execute(
+                "INSERT OR IGNORE INTO term_categories(guild_id, category_name, description) VALUES(?,?,?)",
+                (gid, name, description)
+            )
+            await bot.db.commit()
         
         embed = discord.Embed(
             title="Category Created",
@@ -1101,11 +1647,12 @@ async def cmd_category(ctx: commands.Context, action: str = None, *, args: str =
                 await ctx.send(f"❌ Category `{category}` does not exist.")
                 return
         
-        await bot.db.execute(
-            "INSERT OR REPLACE INTO term_category_assignments(guild_id, term, category_name) VALUES(?,?,?)",
-            (gid, term, category)
-        )
-        await bot.db.commit()
+        async with bot.write_lock:
+            await bot.db.execute(
+                "INSERT OR REPLACE INTO term_category_assignments(guild_id, term, category_name) VALUES(?,?,?)",
+                (gid, term, category)
+            )
+            await bot.db.commit()
         
         await ctx.send(f"✅ Assigned `{term}` to category `{category}`.")
         
@@ -1120,7 +1667,7 @@ async def cmd_alias(ctx: commands.Context, alias: str = None, *, main_term: str
     
     if not alias:
         # List all aliases
-        async with bot.db.execute(
+        async with bot.reader() as db, db.execute(
             "SELECT alias, main_term FROM term_aliases WHERE guild_id=? ORDER BY alias",
             (gid,)
         ) as cur:
@@ -1150,12 +1697,14 @@ async def cmd_alias(ctx: commands.Context, alias: str = None, *, main_term: str
             await ctx.send(f"❌ Main term `{main_term}` is not being tracked.")
             return
     
-    await bot.db.execute(
-        "INSERT OR REPLACE INTO term_aliases(guild_id, alias, main_term) VALUES(?,?,?)",
-        (gid, alias, main_term)
-    )
-    await bot.db.commit()
-    await bot.refresh_patterns()
+    async with bot.write_lock:
+        await bot.db.execute(
+            "INSERT OR REPLACE INTO term_aliases(guild_id, alias, main_term) VALUES(?,?,?)",
+            (gid, alias, main_term)
+        )
+        await bot.db.commit()
+    bot.aliases.setdefault(gid, {})[alias] = main_term
+    await bot.refresh_guild_patterns(gid)
     
     await ctx.send(f"✅ Created alias `{alias}` → `{main_term}`")
 
@@ -1166,30 +1715,32 @@ async def cmd_dashboard(ctx: commands.Context):
     settings = await bot.get_guild_settings(gid)
     
     # Get overall stats
-    async with bot.db.execute(
+    async with bot.reader() as db, db.execute(
         "SELECT COUNT(DISTINCT term), COALESCE(SUM(total_count), 0) FROM term_meta WHERE guild_id=?",
         (gid,)
     ) as cur:
         total_terms, total_mentions = await cur.fetchone()
     
-    async with bot.db.execute(
+    async with bot.reader() as db, db.execute(
         "SELECT COUNT(DISTINCT user_id) FROM hits WHERE guild_id=?",
         (gid,)
     ) as cur:
         active_users = (await cur.fetchone())[0] or 0
     
-    # Get today's stats
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    async with bot.db.execute(
-        "SELECT COUNT(*) FROM messages WHERE guild_id=? AND DATE(created_at) = ?",
-        (gid, today)
+    # Get today's stats; ISO timestamps sort as text, so a day is a range starting at its date
+    now = datetime.now(timezone.utc)
+    today = now.strftime("%Y-%m-%d")
+    tomorrow = (now + timedelta(days=1)).strftime("%Y-%m-%d")
+    async with bot.reader() as db, db.execute(
+        "SELECT COUNT(*) FROM messages WHERE guild_id=? AND created_at >= ? AND created_at < ?",
+        (gid, today, tomorrow)
     ) as cur:
         today_mentions = (await cur.fetchone())[0] or 0
     
     # Get top term today
-    async with bot.db.execute(
-        "SELECT term, COUNT(*) as count FROM messages WHERE guild_id=? AND DATE(created_at) = ? GROUP BY term ORDER BY count DESC LIMIT 1",
-        (gid, today)
+    async with bot.reader() as db, db.execute(
+        "SELECT term, COUNT(*) as count FROM messages WHERE guild_id=? AND created_at >= ? AND created_at < ? GROUP BY term ORDER BY count DESC LIMIT 1",
+        (gid, today, tomorrow)
     ) as cur:
         top_today = await cur.fetchone()
     
@@ -1210,7 +1761,7 @@ async def cmd_dashboard(ctx: commands.Context):
     embed.add_field(name="📈 Overview", value=overview, inline=True)
     
     # Recent activity
-    async with bot.db.execute(
+    async with bot.reader() as db, db.execute(
         "SELECT term, COUNT(*) as mentions FROM messages WHERE guild_id=? AND created_at >= ? GROUP BY term ORDER BY mentions DESC LIMIT 5",
         (gid, (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat())
     ) as cur:
@@ -1222,7 +1773,7 @@ async def cmd_dashboard(ctx: commands.Context):
     
     # Top users this week
     week_ago = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
-    async with bot.db.execute(
+    async with bot.reader() as db, db.execute(
         "SELECT user_name, COUNT(*) as mentions FROM messages WHERE guild_id=? AND created_at >= ? GROUP BY user_id, user_name ORDER BY mentions DESC LIMIT 5",
         (gid, week_ago)
     ) as cur:
@@ -1243,7 +1794,7 @@ async def cmd_trends(ctx: commands.Context, days: int = 7):
     
     cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
     
-    async with bot.db.execute(
+    async with bot.reader() as db, db.execute(
         """SELECT term, COUNT(*) as recent_mentions,
                   COALESCE(tm.total_count, 0) as total_mentions
            FROM messages m
@@ -1314,22 +1865,23 @@ async def cmd_settings(ctx: commands.Context):
     embed.add_field(name="🔧 Advanced Settings", value="\n".join(advanced), inline=True)
     
     # Show ignored channels
-    async with bot.db.execute("SELECT channel_id FROM ignored_channels WHERE guild_id=?", (gid,)) as cur:
-        ignored = []
-        async for row in cur:
-            channel = ctx.guild.get_channel(row[0]) if ctx.guild else None
-            if channel:
-                ignored.append(f"#{channel.name}")
+    async with bot.reader() as db, db.execute("SELECT channel_id FROM ignored_channels WHERE guild_id=?", (gid,)) as cur:
+        rows = await cur.fetchall()
+    ignored = []
+    for (channel_id,) in rows:
+        channel = ctx.guild.get_channel(channel_id) if ctx.guild else None
+        if channel:
+            ignored.append(f"#{channel.name}")
     
     if ignored:
         embed.add_field(name="🚫 Ignored Channels", value=", ".join(ignored), inline=False)
     
     # Statistics
-    async with bot.db.execute("SELECT COUNT(*) FROM terms WHERE guild_id=?", (gid,)) as cur:
+    async with bot.reader() as db, db.execute("SELECT COUNT(*) FROM terms WHERE guild_id=?", (gid,)) as cur:
         term_count = (await cur.fetchone())[0]
-    async with bot.db.execute("SELECT COUNT(*) FROM term_categories WHERE guild_id=?", (gid,)) as cur:
+    async with bot.reader() as db, db.execute("SELECT COUNT(*) FROM term_categories WHERE guild_id=?", (gid,)) as cur:
         category_count = (await cur.fetchone())[0]
-    async with bot.db.execute("SELECT COUNT(*) FROM term_aliases WHERE guild_id=?", (gid,)) as cur:
+    async with bot.reader() as db, db.execute("SELECT COUNT(*) FROM term_aliases WHERE guild_id=?", (gid,)) as cur:
         alias_count = (await cur.fetchone())[0]
     
     stats = f"**Terms**: {term_count} | **Categories**: {category_count} | **Aliases**: {alias_count}"
@@ -1345,104 +1897,91 @@ async def cmd_set(ctx: commands.Context, setting: str, *, value: str):
     setting = setting.lower()
     settings = await bot.get_guild_settings(gid)
     
-    # Initialize settings if they don't exist
-    await bot.db.execute(
-        "INSERT OR IGNORE INTO guild_settings(guild_id) VALUES(?)", (gid,)
-    )
-    
+    # Validate first, so the write below never has to back out
+    refresh = False  # the setting changes how terms are scanned
     if setting in ["ignore_commands", "ignore_command"]:
-        bool_val = value.lower() in ["true", "yes", "1", "on", "enable"]
-        await bot.db.execute(
-            "UPDATE guild_settings SET ignore_commands=? WHERE guild_id=?",
-            (bool_val, gid)
-        )
-        await ctx.send(f"✅ Commands will {'not ' if not bool_val else ''}be ignored for term tracking.")
+        column = "ignore_commands"
+        new_value = value.lower() in ["true", "yes", "1", "on", "enable"]
+        reply = f"✅ Commands will {'not ' if not new_value else ''}be ignored for term tracking."
         
     elif setting in ["case_sensitive", "case"]:
-        bool_val = value.lower() in ["true", "yes", "1", "on", "enable"]
-        await bot.db.execute(
-            "UPDATE guild_settings SET case_sensitive=? WHERE guild_id=?",
-            (bool_val, gid)
-        )
-        await bot.refresh_patterns()
-        await ctx.send(f"✅ Term matching is now {'case sensitive' if bool_val else 'case insensitive'}.")
+        column, refresh = "case_sensitive", True
+        new_value = value.lower() in ["true", "yes", "1", "on", "enable"]
+        reply = f"✅ Term matching is now {'case sensitive' if new_value else 'case insensitive'}."
         
     elif setting in ["min_word_length", "min_length", "minlength"]:
+        column, refresh = "min_word_length", True
         try:
-            int_val = int(value)
-            if int_val < 1:
-                await ctx.send("❌ Minimum word length must be at least 1.")
-                return
-            await bot.db.execute(
-                "UPDATE guild_settings SET min_word_length=? WHERE guild_id=?",
-                (int_val, gid)
-            )
-            await bot.refresh_patterns()
-            await ctx.send(f"✅ Minimum word length set to {int_val}.")
+            new_value = int(value)
         except ValueError:
             await ctx.send("❌ Please provide a valid number.")
+            return
+        if new_value < 1:
+            await ctx.send("❌ Minimum word length must be at least 1.")
+            return
+        reply = f"✅ Minimum word length set to {new_value}."
             
     elif setting in ["cooldown", "cooldown_seconds"]:
+        column = "cooldown_seconds"
         try:
-            int_val = int(value)
-            if int_val < 0:
-                await ctx.send("❌ Cooldown cannot be negative.")
-                return
-            await bot.db.execute(
-                "UPDATE guild_settings SET cooldown_seconds=? WHERE guild_id=?",
-                (int_val, gid)
-            )
-            if int_val == 0:
-                await ctx.send("✅ Cooldown disabled.")
-            else:
-                await ctx.send(f"✅ Cooldown set to {format_duration(int_val)}.")
+            new_value = int(value)
         except ValueError:
             await ctx.send("❌ Please provide a valid number of seconds.")
+            return
+        if new_value < 0:
+            await ctx.send("❌ Cooldown cannot be negative.")
+            return
+        reply = "✅ Cooldown disabled." if new_value == 0 else f"✅ Cooldown set to {format_duration(new_value)}."
             
     elif setting in ["theme_color", "color"]:
+        column = "theme_color"
         try:
             # Accept hex colors
             if value.startswith('#'):
-                color_val = int(value[1:], 16)
+                new_value = int(value[1:], 16)
             else:
-                color_val = int(value)
-            
-            await bot.db.execute(
-                "UPDATE guild_settings SET theme_color=? WHERE guild_id=?",
-                (color_val, gid)
-            )
-            await ctx.send(f"✅ Theme color set to #{color_val:06x}.")
+                new_value = int(value)
         except ValueError:
             await ctx.send("❌ Please provide a valid color (hex or decimal).")
+            return
+        reply = f"✅ Theme color set to #{new_value:06x}."
             
     elif setting in ["daily_summary"]:
-        bool_val = value.lower() in ["true", "yes", "1", "on", "enable"]
-        await bot.db.execute(
-            "UPDATE guild_settings SET daily_summary=? WHERE guild_id=?",
-            (bool_val, gid)
-        )
-        await ctx.send(f"✅ Daily summary {'enabled' if bool_val else 'disabled'}.")
+        column = "daily_summary"
+        new_value = value.lower() in ["true", "yes", "1", "on", "enable"]
+        reply = f"✅ Daily summary {'enabled' if new_value else 'disabled'}."
         
     elif setting in ["notification_channel"]:
+        column = "notification_channel"
         try:
-            channel_id = int(value.replace('<#', '').replace('>', ''))
-            channel = ctx.guild.get_channel(channel_id)
-            if not channel:
-                await ctx.send("❌ Channel not found.")
-                return
-                
-            await bot.db.execute(
-                "UPDATE guild_settings SET notification_channel=? WHERE guild_id=?",
-                (channel_id, gid)
-            )
-            await ctx.send(f"✅ Notification channel set to {channel.mention}.")
+            new_value = int(value.replace('<#', '').replace('>', ''))
         except ValueError:
             await ctx.send("❌ Please provide a valid channel mention or ID.")
+            return
+        channel = ctx.guild.get_channel(new_value)
+        if not channel:
+            await ctx.send("❌ Channel not found.")
+            return
+        reply = f"✅ Notification channel set to {channel.mention}."
     else:
         await ctx.send("❌ Unknown setting. Available: ignore_commands, case_sensitive, min_word_length, cooldown, theme_color, daily_summary, notification_channel")
         return
     
-    await bot.db.commit()
+    async with bot.write_lock:
+        # Initialize settings if they don't exist
+        await bot.db.execute(
+            "INSERT OR IGNORE INTO guild_settings(guild_id) VALUES(?)", (gid,)
+        )
+        await bot.db.execute(
+            f"UPDATE guild_settings SET {column}=? WHERE guild_id=?",
+            (new_value, gid)
+        )
+        await bot.db.commit()
+        bot.invalidate_settings(gid)
+    
+    if refresh:
+        await bot.refresh_guild_patterns(gid)
+    await ctx.send(reply)
 
 @bot.command(name="ignore_channel")
 @commands.check(admin_or_power)
@@ -1459,11 +1998,13 @@ async def cmd_ignore_channel(ctx: commands.Context, channel: discord.TextChannel
         return
     
     now = datetime.now(timezone.utc).isoformat()
-    await bot.db.execute(
-        "INSERT INTO ignored_channels(guild_id, channel_id, ignored_by, ignored_at) VALUES(?, ?, ?, ?)",
-        (gid, channel.id, ctx.author.id, now)
-    )
-    await bot.db.commit()
+    async with bot.write_lock:
+        await bot.db.execute(
+            "INSERT INTO ignored_channels(guild_id, channel_id, ignored_by, ignored_at) VALUES(?, ?, ?, ?)",
+            (gid, channel.id, ctx.author.id, now)
+        )
+        await bot.db.commit()
+        bot.invalidate_settings(gid)
     await ctx.send(f"✅ Now ignoring #{channel.name} for term tracking.")
 
 @bot.command(name="unignore_channel")
@@ -1475,11 +2016,13 @@ async def cmd_unignore_channel(ctx: commands.Context, channel: discord.TextChann
     
     gid = ctx.guild.id if ctx.guild else 0
     
-    cur = await bot.db.execute(
-        "DELETE FROM ignored_channels WHERE guild_id=? AND channel_id=?",
-        (gid, channel.id)
-    )
-    await bot.db.commit()
+    async with bot.write_lock:
+        cur = await bot.db.execute(
+            "DELETE FROM ignored_channels WHERE guild_id=? AND channel_id=?",
+            (gid, channel.id)
+        )
+        await bot.db.commit()
+        bot.invalidate_settings(gid)
     
     if cur.rowcount:
         await ctx.send(f"✅ No longer ignoring #{channel.name}.")
@@ -1495,13 +2038,13 @@ async def cmd_recent(ctx: commands.Context, term: str = None, limit: int = 5):
     
     if term:
         term = await bot.resolve_term(gid, normalize_term(term))
-        async with bot.db.execute(
+        async with bot.reader() as db, db.execute(
             "SELECT user_name, content, created_at, channel_id FROM messages WHERE guild_id=? AND term=? ORDER BY created_at DESC LIMIT ?",
             (gid, term, limit)
         ) as cur:
             rows = await cur.fetchall()
     else:
-        async with bot.db.execute(
+        async with bot.reader() as db, db.execute(
             "SELECT user_name, content, created_at, channel_id, term FROM messages WHERE guild_id=? ORDER BY created_at DESC LIMIT ?",
             (gid, limit)
         ) as cur:
@@ -1544,6 +2087,13 @@ async def cmd_recent(ctx: commands.Context, term: str = None, limit: int = 5):
     
     await ctx.send(embed=embed)
 
+# Leaderboard timeframe aliases -> window length in days; anything else is all-time
+LEADERBOARD_TIMEFRAMES = {
+    "day": 1, "daily": 1, "1d": 1,
+    "week": 7, "weekly": 7, "1w": 7,
+    "month": 30, "monthly": 30, "1m": 30,
+}
+
 @bot.command(name="leaderboard", aliases=["lb", "top"])
 async def cmd_leaderboard(ctx: commands.Context, timeframe: str = "all"):
     """Show user leaderboard for all terms"""
@@ -1551,35 +2101,32 @@ async def cmd_leaderboard(ctx: commands.Context, timeframe: str = "all"):
     settings = await bot.get_guild_settings(gid)
     
     # Parse timeframe
-    where_clause = ""
+    days = LEADERBOARD_TIMEFRAMES.get(timeframe.lower())
     params = [gid]
     
-    if timeframe.lower() in ["day", "daily", "1d"]:
-        cutoff = datetime.now(timezone.utc) - timedelta(days=1)
-        where_clause = " AND last_seen >= ?"
-        params.append(cutoff.isoformat())
-    elif timeframe.lower() in ["week", "weekly", "1w"]:
-        cutoff = datetime.now(timezone.utc) - timedelta(weeks=1)
-        where_clause = " AND last_seen >= ?"
+    if days is not None:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
         params.append(cutoff.isoformat())
-    elif timeframe.lower() in ["month", "monthly", "1m"]:
-        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
-        where_clause = " AND last_seen >= ?"
-        params.append(cutoff.isoformat())
-    
-    query = f"""
-        SELECT user_name, SUM(count) as total 
-        FROM hits 
-        WHERE guild_id=?{where_clause}
-        GROUP BY user_id, user_name 
-        ORDER BY total DESC 
-        LIMIT 10
-    """
-    
-    rows = []
-    async with bot.db.execute(query, params) as cur:
-        async for r in cur:
-            rows.append(r)
+        query = """
+            SELECT user_name, SUM(count) as total 
+            FROM hits 
+            WHERE guild_id=? AND last_seen >= ?
+            GROUP BY user_id, user_name 
+            ORDER BY total DESC 
+            LIMIT 10
+        """
+    else:
+        # All-time totals come straight from the rollup instead of summing every hit
+        query = """
+            SELECT user_name, total_count 
+            FROM user_totals 
+            WHERE guild_id=? 
+            ORDER BY total_count DESC 
+            LIMIT 10
+        """
+    
+    async with bot.reader() as db, db.execute(query, params) as cur:
+        rows = await cur.fetchall()
     
     if not rows:
         await ctx.send(f"No data for timeframe: {timeframe}")
@@ -1615,17 +2162,24 @@ async def cmd_search(ctx: commands.Context, *, query: str):
         await ctx.send("❌ Search query must be at least 2 characters.")
         return
     
-    # Use LIKE for partial matching
-    search_query = f"%{query.lower()}%"
-    
-    async with bot.db.execute(
-        """SELECT user_name, content, created_at, channel_id, term 
-           FROM messages 
-           WHERE guild_id=? AND LOWER(content) LIKE ? 
-           ORDER BY created_at DESC 
-           LIMIT 10""",
-        (gid, search_query)
-    ) as cur:
+    if bot.fts_enabled and len(query) >= 3:
+        # The trigram index matches a quoted phrase as a case-insensitive substring, like the LIKE below
+        sql = """SELECT m.user_name, m.content, CAST(strftime('%s', m.created_at) AS INTEGER), m.channel_id, m.term 
+                 FROM messages_fts f JOIN messages m ON m.id = f.rowid 
+                 WHERE messages_fts MATCH ? AND m.guild_id=? 
+                 ORDER BY m.created_at DESC 
+                 LIMIT 10"""
+        params = ('"' + query.replace('"', '""') + '"', gid)
+    else:
+        # Trigrams need 3+ characters; shorter queries use LIKE for partial matching
+        sql = """SELECT user_name, content, CAST(strftime('%s', created_at) AS INTEGER), channel_id, term 
+                 FROM messages 
+                 WHERE guild_id=? AND LOWER(content) LIKE ? 
+                 ORDER BY created_at DESC 
+                 LIMIT 10"""
+        params = (gid, f"%{query.lower()}%")
+    
+    async with bot.reader() as db, db.execute(sql, params) as cur:
         rows = await cur.fetchall()
     
     if not rows:
@@ -1637,24 +2191,32 @@ async def cmd_search(ctx: commands.Context, *, query: str):
         color=settings['theme_color']
     )
     
-    for user_name, content, created_at, channel_id, term in rows:
-        try:
-            timestamp = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            time_str = f"<t:{int(timestamp.timestamp())}:R>"
-        except:
-            time_str = "recently"
+    # Results cluster in a few channels; resolve each name once per render
+    channel_names = {}
+    lines = []
+    length = -2  # the first block has no separator before it
+    
+    for user_name, content, created_ts, channel_id, term in rows:
+        # SQLite hands back the epoch directly; unparseable timestamps come back NULL
+        time_str = f"<t:{created_ts}:R>" if created_ts is not None else "recently"
         
         # Highlight the search term in content
         display_content = content[:150] + "..." if len(content) > 150 else content
         
-        channel = ctx.guild.get_channel(channel_id) if ctx.guild else None
-        channel_name = f"#{channel.name}" if channel else "DM"
+        channel_name = channel_names.get(channel_id)
+        if channel_name is None:
+            channel = ctx.guild.get_channel(channel_id) if ctx.guild else None
+            channel_name = channel_names[channel_id] = f"#{channel.name}" if channel else "DM"
         
-        embed.add_field(
-            name=f"**{user_name}** in {channel_name} (`{term}`)",
-            value=f"{display_content}\n{time_str}",
-            inline=False
-        )
+        block = f"**{user_name}** in {channel_name} (`{term}`)\n{display_content}\n{time_str}"
+        # Discord caps descriptions at 4096 characters; drop whole results rather than cut one's markdown
+        length += len(block) + 2
+        if length > 4096:
+            break
+        lines.append(block)
+    
+    # One description instead of a field per result
+    embed.description = "\n\n".join(lines)
     
     await ctx.send(embed=embed)
 
@@ -1668,9 +2230,22 @@ async def cmd_reset(ctx: commands.Context, *, term: str = None):
     if term:
         term = normalize_term(term)
         
-        # Check if term exists
-        async with bot.db.execute("SELECT total_count FROM term_meta WHERE guild_id=? AND term=?", (gid, term)) as cur:
-            row = await cur.fetchone()
+        async with bot.write_lock:
+            # Deleting the counter row tells us whether the term exists and what it held
+            async with bot.db.execute(
+                "DELETE FROM term_meta WHERE guild_id=? AND term=? RETURNING total_count", (gid, term)
+            ) as cur:
+                row = await cur.fetchone()
+            
+            if row:
+                # Reset the stats but keep the term tracked
+                await bot.db.execute("DELETE FROM hits WHERE guild_id=? AND term=?", (gid, term))
+                await bot.db.execute("DELETE FROM messages WHERE guild_id=? AND term=?", (gid, term))
+                await bot.db.execute("DELETE FROM user_cooldowns WHERE guild_id=? AND term=?", (gid, term))
+                await bot.db.execute("DELETE FROM daily_stats WHERE guild_id=? AND term=?", (gid, term))
+            await bot.db.commit()  # on a miss this just ends the empty write transaction the DELETE opened
+            if row:
+                bot.invalidate_user_state(gid)
         
         if not row:
             await ctx.send(f"❌ `{term}` is not being tracked.")
@@ -1678,14 +2253,6 @@ async def cmd_reset(ctx: commands.Context, *, term: str = None):
         
         total_count = row[0] or 0
         
-        # Reset the stats but keep the term tracked
-        await bot.db.execute("DELETE FROM term_meta WHERE guild_id=? AND term=?", (gid, term))
-        await bot.db.execute("DELETE FROM hits WHERE guild_id=? AND term=?", (gid, term))
-        await bot.db.execute("DELETE FROM messages WHERE guild_id=? AND term=?", (gid, term))
-        await bot.db.execute("DELETE FROM user_cooldowns WHERE guild_id=? AND term=?", (gid, term))
-        await bot.db.execute("DELETE FROM daily_stats WHERE guild_id=? AND term=?", (gid, term))
-        await bot.db.commit()
-        
         embed = discord.Embed(
             title="Statistics Reset",
             description=f"Reset statistics for `{term}` ({total_count} mentions cleared)",
@@ -1698,10 +2265,12 @@ async def cmd_reset(ctx: commands.Context, *, term: str = None):
             total_messages = (await cur.fetchone())[0]
         
         tables_to_reset = ["term_meta", "hits", "messages", "user_cooldowns", "daily_stats"]
-        for table in tables_to_reset:
-            await bot.db.execute(f"DELETE FROM {table} WHERE guild_id=?", (gid,))
-        
-        await bot.db.commit()
+        async with bot.write_lock:
+            for table in tables_to_reset:
+                await bot.db.execute(f"DELETE FROM {table} WHERE guild_id=?", (gid,))
+            
+            await bot.db.commit()
+            bot.invalidate_user_state(gid)
         
         embed = discord.Embed(
             title="All Statistics Reset",
@@ -1800,7 +2369,10 @@ def main():
         os.environ.setdefault("REQUESTS_CA_BUNDLE", certifi.where())
     except Exception:
         pass
-    bot.run(token, reconnect=True)
+    try:
+        bot.run(token, reconnect=True)
+    except asyncio.CancelledError:
+        pass  # SIGTERM: close() has already run
 
 if __name__ == "__main__":
     main()
\ No newline at end of file